@@ -1,71 +1,189 @@
 
 import os
-import glob
 import asyncio
 import sys
-import subprocess
+import threading
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 # Colors for output
 GREEN = "\033[92m"
 RED = "\033[91m"
 RESET = "\033[0m"
 
-async def run_test_file(filepath):
+# Leave a couple of cores free for the server under test
+MAX_WORKERS = max(1, (os.cpu_count() or 2) - 2)
+
+
+class _LineWriter:
+    """Forwards a test's output to the real stream one complete line at a time.
+
+    Lines are tagged with the test name so concurrent tests stay readable, and
+    only the current partial line is held in memory.
+    """
+
+    def __init__(self, prefix, stream):
+        self._prefix = prefix
+        self._stream = stream
+        self._pending = ""
+
+    def write(self, data):
+        lines = (self._pending + data).split("\n")
+        self._pending = lines.pop()
+        if lines:
+            self._stream.write("".join(f"{self._prefix}{line}\n" for line in lines))
+            self._stream.flush()
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if self._pending:
+            self.write("\n")
+
+
+class _ThreadLocalStream:
+    """Routes writes from test worker threads to that test's own writer.
+
+    contextlib.redirect_stdout swaps sys.stdout for the whole process, which
+    breaks as soon as two tests run at once, so each worker registers a writer
+    for its own thread and everything else falls through to the real stream.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self, prefix):
+        self._local.writer = _LineWriter(prefix, self._stream)
+
+    def release(self):
+        self._local.writer.close()
+        self._local.writer = None
+
+    def _target(self):
+        return getattr(self._local, "writer", None) or self._stream
+
+    def write(self, data):
+        return self._target().write(data)
+
+    def flush(self):
+        return self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _exec_test_file(filepath):
+    """Run a TC file in this interpreter the same way `python <file>` would."""
+    prefix = f"[{os.path.basename(filepath)}] "
+    sys.stdout.capture(prefix)
+    sys.stderr.capture(prefix)
+    try:
+        with open(filepath, "rb") as f:
+            code = compile(f.read(), filepath, "exec")
+        exec(code, {"__name__": "__main__", "__file__": filepath})
+        success = True
+    except SystemExit as e:
+        success = e.code in (None, 0)
+    except BaseException:
+        traceback.print_exc()
+        success = False
+    finally:
+        sys.stdout.release()
+        sys.stderr.release()
+    return success
+
+
+async def run_test_file(filepath, executor):
     print(f"Running {filepath}...")
-    start_time = time.time()
-    
-    # We run each test file as a separate process to ensure isolation
-    process = await asyncio.create_subprocess_exec(
-        sys.executable, filepath,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE
-    )
-    
-    stdout, stderr = await process.communicate()
-    end_time = time.time()
+    start_time = time.perf_counter()
+
+    # Run in a worker thread of this interpreter so startup and imports
+    # (requests, urllib3, ...) are paid once for the whole suite. Output is
+    # streamed as the test produces it rather than buffered until it exits.
+    loop = asyncio.get_running_loop()
+    success = await loop.run_in_executor(executor, _exec_test_file, filepath)
+    end_time = time.perf_counter()
     duration = end_time - start_time
-    
-    if process.returncode == 0:
-        print(f"{GREEN}PASS{RESET}: {filepath} ({duration:.2f}s)")
-        return True, stdout.decode(), stderr.decode()
+
+    # One write per result line so lines from concurrent tests never interleave
+    if success:
+        sys.stdout.write(f"{GREEN}PASS{RESET}: {filepath} ({duration:.2f}s)\n")
     else:
-        print(f"{RED}FAIL{RESET}: {filepath} ({duration:.2f}s)")
-        print("STDOUT:", stdout.decode())
-        print("STDERR:", stderr.decode())
-        return False, stdout.decode(), stderr.decode()
+        sys.stdout.write(
+            f"{RED}FAIL{RESET}: {filepath} ({duration:.2f}s), see [{os.path.basename(filepath)}] output above\n"
+        )
+    return success
 
 async def main():
     test_dir = os.path.join(os.getcwd(), "testsprite_tests")
-    test_files = sorted(glob.glob(os.path.join(test_dir, "TC*.py")))
-    
+    # One directory read; DirEntry.is_file() reuses the type from readdir
+    test_files = []
+    placeholders = 0
+    if os.path.isdir(test_dir):
+        with os.scandir(test_dir) as entries:
+            for entry in entries:
+                if not (entry.name.startswith("TC") and entry.name.endswith(".py") and entry.is_file()):
+                    continue
+                # Several TC files are empty placeholders from the test plan
+                # whose scenario is covered by a sibling file; don't run them
+                if entry.stat().st_size == 0:
+                    placeholders += 1
+                else:
+                    test_files.append(entry.path)
+        test_files.sort()
+
     if not test_files:
         print("No test files found in testsprite_tests/")
         return
 
-    print(f"Found {len(test_files)} tests.")
-    
-    results = []
-    
-    for test_file in test_files:
-        success, out, err = await run_test_file(test_file)
-        results.append((test_file, success))
-
-    print("\n" + "="*30)
-    print("TEST SUMMARY")
-    print("="*30)
-    
+    skipped = f" ({placeholders} empty placeholder files skipped)" if placeholders else ""
+    print(f"Found {len(test_files)} tests.{skipped}")
+
+    # Test files import their siblings the same way they would as scripts
+    sys.path.insert(0, test_dir)
+    sys.stdout = _ThreadLocalStream(sys.stdout)
+    sys.stderr = _ThreadLocalStream(sys.stderr)
+
+    # Tests are mostly waiting on the network, so run them concurrently.
+    sem = asyncio.Semaphore(MAX_WORKERS)
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+    async def _run(test_file):
+        async with sem:
+            return test_file, await run_test_file(test_file, executor)
+
+    # gather() returns results in submission order, so the summary stays sorted
+    try:
+        results = await asyncio.gather(*[_run(test_file) for test_file in test_files])
+    finally:
+        executor.shutdown(wait=False)
+
     passed = sum(1 for _, success in results if success)
     failed = len(results) - passed
-    
+
+    # Build the whole summary and write it at once
+    lines = ["", "="*30, "TEST SUMMARY", "="*30]
     for test_file, success in results:
         status = f"{GREEN}PASS{RESET}" if success else f"{RED}FAIL{RESET}"
-        print(f"{status}: {os.path.basename(test_file)}")
-        
-    print(f"\nTotal: {len(results)}, Passed: {passed}, Failed: {failed}")
-    
+        lines.append(f"{status}: {os.path.basename(test_file)}")
+    lines.append(f"\nTotal: {len(results)}, Passed: {passed}, Failed: {failed}\n")
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
+
     if failed > 0:
         sys.exit(1)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional and used when installed. The loop only awaits a few
+    # run_in_executor futures, so it makes no measurable difference here.
+    # uvloop.run() replaces uvloop.install(), deprecated on Python 3.12+.
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -0,0 +1,198 @@
+"""
+Sales Funnel CRM SDK for Python - asyncio client
+
+Installation:
+    pip install crm-sdk httpx[http2]
+
+Usage:
+    from crm_sdk.aclient import AsyncCRMClient
+
+    async with AsyncCRMClient(api_key='your_api_key') as client:
+        leads = await client.leads.bulk_get(["lead_1", "lead_2"])
+"""
+
+import asyncio
+import importlib.util
+from functools import cached_property
+from typing import Optional, Dict, Any, List
+
+import httpx
+
+from .client import (
+    _LEAD_FIELD_MAP,
+    _check_batching,
+    _chunk_records,
+    _import_payload,
+    _json_dumps,
+    _lead_payload,
+    _merge_import_results,
+    _parse_response
+)
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); use HTTP/1.1 without it
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection pool size; bulk_get keeps at most this many requests in flight
+_MAX_CONNECTIONS = 50
+
+
+# Lead Operations
+class AsyncLeads:
+    def __init__(self, client: "AsyncCRMClient"):
+        self._client = client
+
+    async def list(
+        self,
+        page: int = 1,
+        limit: int = 50,
+        status: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """List leads with optional filtering"""
+        params = {"page": page, "limit": limit}
+        if status:
+            params["status"] = status
+        if search:
+            params["search"] = search
+        return await self._client._request("GET", "/api/v1/leads", params=params)
+
+    async def get(self, lead_id: str) -> Dict[str, Any]:
+        """Get a single lead by ID"""
+        return await self._client._request("GET", f"/api/v1/leads/{lead_id}")
+
+    async def bulk_get(self, lead_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get several leads concurrently, in the order of lead_ids"""
+        # Requests waiting on a free pool connection hit httpx's pool timeout,
+        # so don't start more than the pool can serve
+        sem = asyncio.Semaphore(_MAX_CONNECTIONS)
+        
+        async def _bounded(lead_id: str) -> Dict[str, Any]:
+            async with sem:
+                return await self.get(lead_id)
+        
+        return await asyncio.gather(*[_bounded(lead_id) for lead_id in lead_ids])
+
+    async def create(
+        self,
+        client_name: str,
+        email: Optional[str] = None,
+        mobile_number: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        status: str = "NEW",
+        notes: Optional[str] = None,
+        custom_fields: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Create a new lead"""
+        data = _lead_payload(
+            client_name, email, mobile_number, company, source, status, notes, custom_fields
+        )
+        return await self._client._request("POST", "/api/v1/leads", json=data)
+
+    async def update(self, lead_id: str, **kwargs) -> Dict[str, Any]:
+        """Update an existing lead"""
+        # Convert snake_case to camelCase
+        data = {_LEAD_FIELD_MAP.get(key, key): value for key, value in kwargs.items()}
+
+        return await self._client._request("PUT", f"/api/v1/leads/{lead_id}", json=data)
+
+    async def delete(self, lead_id: str) -> Dict[str, Any]:
+        """Delete a lead"""
+        return await self._client._request("DELETE", f"/api/v1/leads/{lead_id}")
+
+    async def bulk_import(
+        self,
+        records: List[Dict],
+        skip_duplicates: bool = True,
+        chunk_size: int = 500,
+        max_parallel: int = 4
+    ) -> Dict[str, Any]:
+        """Bulk import leads
+
+        Same batching as CRMClient.leads.bulk_import: one batch at a time
+        with skip_duplicates, otherwise at most max_parallel in flight.
+        When a batch fails, the batches still pending are cancelled.
+        """
+        _check_batching(chunk_size, max_parallel)
+        chunks = _chunk_records(records, chunk_size)
+        if len(chunks) <= 1:
+            return await self._import_chunk(records, skip_duplicates)
+        
+        if skip_duplicates:
+            responses = [await self._import_chunk(chunk, skip_duplicates) for chunk in chunks]
+            return _merge_import_results(responses, chunk_size)
+        
+        sem = asyncio.Semaphore(max_parallel)
+        
+        async def _bounded(chunk: List[Dict]) -> Dict[str, Any]:
+            async with sem:
+                return await self._import_chunk(chunk, skip_duplicates)
+        
+        tasks = [asyncio.ensure_future(_bounded(chunk)) for chunk in chunks]
+        try:
+            responses = await asyncio.gather(*tasks)
+        except BaseException:
+            # gather() leaves the other tasks running; stop them the way
+            # executor.map does in the sync client
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return _merge_import_results(responses, chunk_size)
+
+    async def _import_chunk(self, records: List[Dict], skip_duplicates: bool) -> Dict[str, Any]:
+        return await self._client._request(
+            "POST",
+            "/api/bulk/import",
+            json=_import_payload(records, skip_duplicates)
+        )
+
+
+class AsyncCRMClient:
+    """Sales Funnel CRM API Client for asyncio applications
+
+    All requests share one pooled httpx.AsyncClient, so concurrent calls are
+    multiplexed over a handful of connections (a single one with HTTP/2).
+    """
+    
+    def __init__(self, api_key: str, base_url: str = "https://api.example.com"):
+        self.api_key = api_key
+        self.base_url = base_url
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            headers={
+                "X-API-Key": api_key,
+                "Content-Type": "application/json"
+            },
+            http2=_HTTP2_AVAILABLE,
+            # requests (CRMClient) follows redirects, httpx doesn't by default
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=_MAX_CONNECTIONS, max_keepalive_connections=20)
+        )
+    
+    async def __aenter__(self) -> "AsyncCRMClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the underlying connection pool"""
+        await self._client.aclose()
+    
+    async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make an API request"""
+        # Serialize the body ourselves; the client already sends Content-Type
+        if kwargs.get("json") is not None:
+            kwargs["content"] = _json_dumps(kwargs.pop("json"))
+        response = await self._client.request(method, endpoint, **kwargs)
+        return _parse_response(response, response.is_success)
+    
+    @cached_property
+    def leads(self) -> AsyncLeads:
+        return AsyncLeads(self)
+
+
+def create_async_client(api_key: str, base_url: str = "https://api.example.com") -> AsyncCRMClient:
+    """Create an asyncio CRM client instance"""
+    return AsyncCRMClient(api_key, base_url)
@@ -9,9 +9,37 @@ Usage:
     client = CRMClient(api_key='your_api_key')
 """
 
+import sys
 import requests
 from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from functools import cached_property
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        # json.dumps turns int/float/bool keys into strings; orjson needs
+        # to be told to, or it raises TypeError on e.g. custom_fields={1: "x"}
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional, fall back to the stdlib
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+
+# snake_case SDK argument -> camelCase API field, for names that differ
+_LEAD_FIELD_MAP = {
+    "client_name": "clientName",
+    "mobile_number": "mobileNumber",
+    "custom_fields": "customFields"
+}
 
 
 class CRMError(Exception):
@@ -23,7 +51,27 @@ class CRMError(Exception):
         super().__init__(self.message)
 
 
-@dataclass
+def _slotted_dataclass(cls: type) -> type:
+    """dataclass(slots=True), which only exists on Python 3.10+
+
+    A plain __slots__ in the class body clashes with the field defaults, so
+    on older versions the class is rebuilt with slots after dataclass() has
+    recorded them, the same way 3.10 does it.
+    """
+    if sys.version_info >= (3, 10):
+        return dataclass(slots=True)(cls)
+    cls = dataclass(cls)
+    namespace = dict(cls.__dict__)
+    names = tuple(f.name for f in fields(cls))
+    namespace["__slots__"] = names
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted_dataclass
 class Lead:
     """Lead data class"""
     id: str
@@ -34,11 +82,304 @@ class Lead:
     source: Optional[str] = None
     status: str = "NEW"
     notes: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Lead":
+        """Build a Lead from an API lead object, ignoring fields it doesn't model"""
+        return cls(**{
+            name: data[key] for key, name in _LEAD_API_FIELDS.items() if key in data
+        })
+
+
+# camelCase API field -> Lead attribute
+_LEAD_API_FIELDS = {_LEAD_FIELD_MAP.get(f.name, f.name): f.name for f in fields(Lead)}
+
+
+def _lead_payload(
+    client_name: str,
+    email: Optional[str],
+    mobile_number: Optional[str],
+    company: Optional[str],
+    source: Optional[str],
+    status: str,
+    notes: Optional[str],
+    custom_fields: Optional[Dict]
+) -> Dict[str, Any]:
+    """Build the create-lead request body, leaving out empty optional fields"""
+    data = {
+        "clientName": client_name,
+        "status": status
+    }
+    data.update({
+        key: value for key, value in (
+            ("email", email),
+            ("mobileNumber", mobile_number),
+            ("company", company),
+            ("source", source),
+            ("notes", notes),
+            ("customFields", custom_fields)
+        ) if value
+    })
+    return data
+
+
+def _parse_response(response: Any, ok: bool) -> Dict[str, Any]:
+    """Decode an API response body, raising CRMError for failed requests"""
+    try:
+        data = _json_loads(response.content)
+    except ValueError:  # json/orjson JSONDecodeError, bad encoding
+        if ok:
+            return {}
+        raise CRMError(
+            message=response.text or "API request failed",
+            code="UNKNOWN",
+            status=response.status_code
+        )
+    
+    if not ok:
+        error = data.get("error") if isinstance(data, dict) else None
+        if isinstance(error, dict):
+            message, code = error.get("message"), error.get("code")
+        else:
+            # The app's standard body: {"success": false, "error": "CODE", "message": "..."}
+            message, code = data.get("message") if error is not None or isinstance(data, dict) else None, error
+        raise CRMError(
+            message=message or "API request failed",
+            code=code or "UNKNOWN_ERROR",
+            status=response.status_code
+        )
+    
+    return data
+
+
+def _import_payload(records: List[Dict], skip_duplicates: bool) -> Dict[str, Any]:
+    """Build the bulk-import request body for a batch of lead records"""
+    return {
+        "records": records,
+        "entityType": "leads",
+        "options": {"skipDuplicates": skip_duplicates}
+    }
+
+
+def _chunk_records(records: List[Dict], chunk_size: int) -> List[List[Dict]]:
+    """Split records into consecutive batches of at most chunk_size"""
+    return [records[i:i + chunk_size] for i in range(0, len(records), chunk_size)]
+
+
+def _check_batching(chunk_size: int, max_parallel: int) -> None:
+    """Reject batch settings that can't split or send any records"""
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    if max_parallel < 1:
+        raise ValueError(f"max_parallel must be at least 1, got {max_parallel}")
+
+
+def _merge_import_results(responses: List[Dict[str, Any]], chunk_size: int) -> Dict[str, Any]:
+    """Combine per-batch bulk-import responses into one
+
+    Error rows are numbered within their own batch by the server, so they
+    are shifted back to their position in the full record list.
+    """
+    merged = {"total": 0, "successful": 0, "failed": 0, "skipped": 0, "errors": [], "created": []}
+    for index, response in enumerate(responses):
+        result = response.get("data") or {}
+        for key in ("total", "successful", "failed", "skipped"):
+            merged[key] += result.get(key, 0)
+        offset = index * chunk_size
+        merged["errors"].extend(
+            {**error, "row": error.get("row", 0) + offset} for error in result.get("errors", [])
+        )
+        merged["created"].extend(result.get("created", []))
+    
+    return {
+        "success": True,
+        "data": merged,
+        "message": (
+            f"Import complete: {merged['successful']} created, "
+            f"{merged['failed']} failed, {merged['skipped']} skipped"
+        )
+    }
+
+
+# Lead Operations
+class Leads:
+    def __init__(self, client: "CRMClient"):
+        self._client = client
+
+    def list(
+        self,
+        page: int = 1,
+        limit: int = 50,
+        status: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """List leads with optional filtering"""
+        params = {"page": page, "limit": limit}
+        if status:
+            params["status"] = status
+        if search:
+            params["search"] = search
+        return self._client._request("GET", "/api/v1/leads", params=params)
+
+    def get(self, lead_id: str) -> Dict[str, Any]:
+        """Get a single lead by ID"""
+        return self._client._request("GET", f"/api/v1/leads/{lead_id}")
+
+    def create(
+        self,
+        client_name: str,
+        email: Optional[str] = None,
+        mobile_number: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        status: str = "NEW",
+        notes: Optional[str] = None,
+        custom_fields: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Create a new lead"""
+        data = _lead_payload(
+            client_name, email, mobile_number, company, source, status, notes, custom_fields
+        )
+        return self._client._request("POST", "/api/v1/leads", json=data)
+
+    def update(self, lead_id: str, **kwargs) -> Dict[str, Any]:
+        """Update an existing lead"""
+        # Convert snake_case to camelCase
+        data = {_LEAD_FIELD_MAP.get(key, key): value for key, value in kwargs.items()}
+
+        return self._client._request("PUT", f"/api/v1/leads/{lead_id}", json=data)
+
+    def delete(self, lead_id: str) -> Dict[str, Any]:
+        """Delete a lead"""
+        return self._client._request("DELETE", f"/api/v1/leads/{lead_id}")
+
+    def bulk_import(
+        self,
+        records: List[Dict],
+        skip_duplicates: bool = True,
+        chunk_size: int = 500,
+        max_parallel: int = 4
+    ) -> Dict[str, Any]:
+        """Bulk import leads
+
+        Records are sent in batches of chunk_size and the per-batch results
+        are merged into a single response. If a batch fails the CRMError is
+        raised and batches not yet sent are dropped, but batches that already
+        succeeded stay imported. Raises ValueError if chunk_size or
+        max_parallel is less than 1.
+
+        The server only skips duplicates of stored leads and of records in
+        the same request, so with skip_duplicates the batches are sent one
+        at a time; up to max_parallel run at once only without it.
+        """
+        _check_batching(chunk_size, max_parallel)
+        chunks = _chunk_records(records, chunk_size)
+        if len(chunks) <= 1:
+            return self._import_chunk(records, skip_duplicates)
+        
+        if skip_duplicates:
+            responses = [self._import_chunk(chunk, skip_duplicates) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+                responses = list(executor.map(
+                    lambda chunk: self._import_chunk(chunk, skip_duplicates), chunks
+                ))
+        return _merge_import_results(responses, chunk_size)
+    
+    def _import_chunk(self, records: List[Dict], skip_duplicates: bool) -> Dict[str, Any]:
+        return self._client._request(
+            "POST",
+            "/api/bulk/import",
+            json=_import_payload(records, skip_duplicates)
+        )
+
+    def export(
+        self,
+        format: str = "json",
+        status: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Export leads"""
+        params = {"format": format, "entityType": "leads"}
+        if status:
+            params["status"] = status
+        return self._client._request("GET", "/api/bulk/export", params=params)
+
+
+# Webhook Operations
+class Webhooks:
+    def __init__(self, client: "CRMClient"):
+        self._client = client
+
+    def list(self) -> Dict[str, Any]:
+        """List webhook subscriptions"""
+        return self._client._request("GET", "/api/webhooks/outgoing")
+
+    def subscribe(
+        self,
+        url: str,
+        events: List[str],
+        auth_type: str = "API_KEY",
+        auth_config: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Subscribe to webhook events"""
+        data = {
+            "url": url,
+            "events": events,
+            "authType": auth_type
+        }
+        if auth_config:
+            data["authConfig"] = auth_config
+        return self._client._request("POST", "/api/webhooks/outgoing", json=data)
+
+    def unsubscribe(self, subscription_id: str) -> Dict[str, Any]:
+        """Unsubscribe from webhook"""
+        return self._client._request("DELETE", f"/api/webhooks/outgoing/{subscription_id}")
+
+
+# Integration Operations
+class Integrations:
+    def __init__(self, client: "CRMClient"):
+        self._client = client
+
+    def list(self, category: Optional[str] = None) -> Dict[str, Any]:
+        """List available integrations"""
+        params = {}
+        if category:
+            params["category"] = category
+        return self._client._request("GET", "/api/integrations", params=params)
+
+    def install(self, slug: str, config: Dict) -> Dict[str, Any]:
+        """Install an integration"""
+        return self._client._request(
+            "POST",
+            f"/api/integrations/{slug}/install",
+            json={"config": config}
+        )
+
+    def uninstall(self, slug: str) -> Dict[str, Any]:
+        """Uninstall an integration"""
+        return self._client._request("DELETE", f"/api/integrations/{slug}/install")
+
+
+# Analytics Operations
+class Analytics:
+    def __init__(self, client: "CRMClient"):
+        self._client = client
+
+    def usage(self, days: int = 30) -> Dict[str, Any]:
+        """Get API usage statistics"""
+        return self._client._request("GET", "/api/analytics/usage", params={"days": days})
 
 
 class CRMClient:
     """Sales Funnel CRM API Client"""
     
+    # Kept so existing CRMClient.Leads style references keep working
+    Leads = Leads
+    Webhooks = Webhooks
+    Integrations = Integrations
+    Analytics = Analytics
+    
     def __init__(self, api_key: str, base_url: str = "https://api.example.com"):
         self.api_key = api_key
         self.base_url = base_url
@@ -51,201 +392,27 @@ class CRMClient:
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make an API request"""
         url = f"{self.base_url}{endpoint}"
+        # Serialize the body ourselves; the session already sends Content-Type
+        if kwargs.get("json") is not None:
+            kwargs["data"] = _json_dumps(kwargs.pop("json"))
         response = self.session.request(method, url, **kwargs)
-        
-        try:
-            data = response.json()
-        except:
-            data = {"error": {"message": response.text, "code": "UNKNOWN"}}
-        
-        if not response.ok:
-            raise CRMError(
-                message=data.get("error", {}).get("message", "API request failed"),
-                code=data.get("error", {}).get("code", "UNKNOWN_ERROR"),
-                status=response.status_code
-            )
-        
-        return data
-    
-    # Lead Operations
-    class Leads:
-        def __init__(self, client: "CRMClient"):
-            self._client = client
-        
-        def list(
-            self,
-            page: int = 1,
-            limit: int = 50,
-            status: Optional[str] = None,
-            search: Optional[str] = None
-        ) -> Dict[str, Any]:
-            """List leads with optional filtering"""
-            params = {"page": page, "limit": limit}
-            if status:
-                params["status"] = status
-            if search:
-                params["search"] = search
-            return self._client._request("GET", "/api/v1/leads", params=params)
-        
-        def get(self, lead_id: str) -> Dict[str, Any]:
-            """Get a single lead by ID"""
-            return self._client._request("GET", f"/api/v1/leads/{lead_id}")
-        
-        def create(
-            self,
-            client_name: str,
-            email: Optional[str] = None,
-            mobile_number: Optional[str] = None,
-            company: Optional[str] = None,
-            source: Optional[str] = None,
-            status: str = "NEW",
-            notes: Optional[str] = None,
-            custom_fields: Optional[Dict] = None
-        ) -> Dict[str, Any]:
-            """Create a new lead"""
-            data = {
-                "clientName": client_name,
-                "status": status
-            }
-            if email:
-                data["email"] = email
-            if mobile_number:
-                data["mobileNumber"] = mobile_number
-            if company:
-                data["company"] = company
-            if source:
-                data["source"] = source
-            if notes:
-                data["notes"] = notes
-            if custom_fields:
-                data["customFields"] = custom_fields
-            
-            return self._client._request("POST", "/api/v1/leads", json=data)
-        
-        def update(self, lead_id: str, **kwargs) -> Dict[str, Any]:
-            """Update an existing lead"""
-            # Convert snake_case to camelCase
-            data = {}
-            field_map = {
-                "client_name": "clientName",
-                "mobile_number": "mobileNumber",
-                "custom_fields": "customFields"
-            }
-            for key, value in kwargs.items():
-                camel_key = field_map.get(key, key)
-                data[camel_key] = value
-            
-            return self._client._request("PUT", f"/api/v1/leads/{lead_id}", json=data)
-        
-        def delete(self, lead_id: str) -> Dict[str, Any]:
-            """Delete a lead"""
-            return self._client._request("DELETE", f"/api/v1/leads/{lead_id}")
-        
-        def bulk_import(
-            self,
-            records: List[Dict],
-            skip_duplicates: bool = True
-        ) -> Dict[str, Any]:
-            """Bulk import leads"""
-            return self._client._request(
-                "POST",
-                "/api/bulk/import",
-                json={
-                    "records": records,
-                    "entityType": "leads",
-                    "options": {"skipDuplicates": skip_duplicates}
-                }
-            )
-        
-        def export(
-            self,
-            format: str = "json",
-            status: Optional[str] = None
-        ) -> Dict[str, Any]:
-            """Export leads"""
-            params = {"format": format, "entityType": "leads"}
-            if status:
-                params["status"] = status
-            return self._client._request("GET", "/api/bulk/export", params=params)
+        return _parse_response(response, response.ok)
     
-    @property
+    @cached_property
     def leads(self) -> Leads:
-        return self.Leads(self)
+        return Leads(self)
     
-    # Webhook Operations
-    class Webhooks:
-        def __init__(self, client: "CRMClient"):
-            self._client = client
-        
-        def list(self) -> Dict[str, Any]:
-            """List webhook subscriptions"""
-            return self._client._request("GET", "/api/webhooks/outgoing")
-        
-        def subscribe(
-            self,
-            url: str,
-            events: List[str],
-            auth_type: str = "API_KEY",
-            auth_config: Optional[Dict] = None
-        ) -> Dict[str, Any]:
-            """Subscribe to webhook events"""
-            data = {
-                "url": url,
-                "events": events,
-                "authType": auth_type
-            }
-            if auth_config:
-                data["authConfig"] = auth_config
-            return self._client._request("POST", "/api/webhooks/outgoing", json=data)
-        
-        def unsubscribe(self, subscription_id: str) -> Dict[str, Any]:
-            """Unsubscribe from webhook"""
-            return self._client._request("DELETE", f"/api/webhooks/outgoing/{subscription_id}")
-    
-    @property
+    @cached_property
     def webhooks(self) -> Webhooks:
-        return self.Webhooks(self)
+        return Webhooks(self)
     
-    # Integration Operations
-    class Integrations:
-        def __init__(self, client: "CRMClient"):
-            self._client = client
-        
-        def list(self, category: Optional[str] = None) -> Dict[str, Any]:
-            """List available integrations"""
-            params = {}
-            if category:
-                params["category"] = category
-            return self._client._request("GET", "/api/integrations", params=params)
-        
-        def install(self, slug: str, config: Dict) -> Dict[str, Any]:
-            """Install an integration"""
-            return self._client._request(
-                "POST",
-                f"/api/integrations/{slug}/install",
-                json={"config": config}
-            )
-        
-        def uninstall(self, slug: str) -> Dict[str, Any]:
-            """Uninstall an integration"""
-            return self._client._request("DELETE", f"/api/integrations/{slug}/install")
-    
-    @property
+    @cached_property
     def integrations(self) -> Integrations:
-        return self.Integrations(self)
-    
-    # Analytics Operations
-    class Analytics:
-        def __init__(self, client: "CRMClient"):
-            self._client = client
-        
-        def usage(self, days: int = 30) -> Dict[str, Any]:
-            """Get API usage statistics"""
-            return self._client._request("GET", f"/api/analytics/usage?days={days}")
+        return Integrations(self)
     
-    @property
+    @cached_property
     def analytics(self) -> Analytics:
-        return self.Analytics(self)
+        return Analytics(self)
 
 
 def create_client(api_key: str, base_url: str = "https://api.example.com") -> CRMClient:
@@ -0,0 +1,71 @@
+"""Tests for the asyncio client. Run from sdks/python: python -m pytest tests"""
+
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from crm_sdk.aclient import AsyncCRMClient
+from crm_sdk.client import CRMError
+
+IMPORT_OK = {"success": True, "data": {"total": 1, "successful": 1, "failed": 0, "skipped": 0}}
+IMPORT_FAILED = {"success": False, "error": {"code": "IMPORT_FAILED", "message": "Import failed"}}
+
+
+def _client(handler):
+    client = AsyncCRMClient(api_key="test", base_url="http://crm.test")
+    client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_bulk_import_cancels_pending_batches_on_failure():
+    posted = []
+
+    async def handler(request):
+        posted.append(request)
+        if len(posted) == 1:
+            return httpx.Response(500, json=IMPORT_FAILED)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=IMPORT_OK)
+
+    async def run():
+        async with _client(handler) as client:
+            with pytest.raises(CRMError):
+                await client.leads.bulk_import(
+                    [{"email": f"{i}@example.com"} for i in range(10)],
+                    skip_duplicates=False,
+                    chunk_size=1,
+                    max_parallel=2
+                )
+            # Give any batch that wasn't cancelled the chance to go out
+            await asyncio.sleep(0.2)
+
+    asyncio.run(run())
+    # Without cancelling, all 10 batches would have been posted by now
+    assert len(posted) <= 3
+
+
+def test_bulk_import_sends_batches_one_at_a_time_when_skipping_duplicates():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=IMPORT_OK)
+
+    async def run():
+        async with _client(handler) as client:
+            return await client.leads.bulk_import(
+                [{"email": f"{i}@example.com"} for i in range(5)],
+                chunk_size=1,
+                max_parallel=4
+            )
+
+    result = asyncio.run(run())
+    assert peak == 1
+    assert result["data"]["successful"] == 5
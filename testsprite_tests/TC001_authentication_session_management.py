@@ -1,10 +1,12 @@
-import requests
+from _http import pooled_session
 
 BASE_URL = "http://localhost:3000"
-TIMEOUT = 30
+TIMEOUT = 5
 
 def test_authentication_session_management():
-    session = requests.Session()
+    # Logs in, out and changes the password, so keep its cookies and headers
+    # off the SESSION the other TC files share
+    session = pooled_session()
     try:
         # 1. Login with default credentials
         login_payload = {
@@ -19,7 +21,7 @@ def test_authentication_session_management():
         # Store auth token or session cookie if provided
         if "token" in login_data:
             token = login_data["token"]
-            session.headers.update({"Authorization": f"Bearer {token}"})
+            session.headers["Authorization"] = f"Bearer {token}"
         
         # 2. Access a protected endpoint to verify session validity
         dashboard_resp = session.get(f"{BASE_URL}/api/dashboard", timeout=TIMEOUT)
@@ -51,7 +53,7 @@ def test_authentication_session_management():
         
         if "token" in relogin_resp.json():
             relogin_token = relogin_resp.json()["token"]
-            session.headers.update({"Authorization": f"Bearer {relogin_token}"})
+            session.headers["Authorization"] = f"Bearer {relogin_token}"
         else:
             session.headers.pop("Authorization", None)
         
@@ -69,4 +71,5 @@ def test_authentication_session_management():
         except Exception:
             pass
 
-test_authentication_session_management()
\ No newline at end of file
+if __name__ == "__main__":
+    test_authentication_session_management()
@@ -1,16 +1,15 @@
 import requests
 
+from _http import SESSION as session
+
 BASE_URL = "http://localhost:3000"
 EMAIL_SYNC_ENDPOINT = f"{BASE_URL}/api/email/sync"
-TIMEOUT = 30
-HEADERS = {
-    "Content-Type": "application/json"
-}
+TIMEOUT = 5
 
 def test_email_synchronization_trigger():
     try:
         # Trigger email synchronization
-        response = requests.post(EMAIL_SYNC_ENDPOINT, headers=HEADERS, timeout=TIMEOUT)
+        response = session.post(EMAIL_SYNC_ENDPOINT, timeout=TIMEOUT)
     except requests.RequestException as e:
         assert False, f"Request to email sync endpoint failed with exception: {e}"
 
@@ -39,4 +38,5 @@ def test_email_synchronization_trigger():
         if resp_json is not None:
             assert "error" in resp_json or "message" in resp_json, "Expected error message in response"
 
-test_email_synchronization_trigger()
\ No newline at end of file
+if __name__ == "__main__":
+    test_email_synchronization_trigger()
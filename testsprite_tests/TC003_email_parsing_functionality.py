@@ -1,30 +1,29 @@
+import json
+
 import requests
 
+from _http import SESSION as session
+
 BASE_URL = "http://localhost:3000"
 EMAIL_PARSE_ENDPOINT = f"{BASE_URL}/api/email/parse"
-TIMEOUT = 30
+TIMEOUT = 5
 
-def test_email_parsing_functionality():
-    # Sample raw email content for parsing
-    raw_email = (
-        "From: sender@example.com\r\n"
-        "To: recipient@example.com\r\n"
-        "Subject: Test Email Parsing\r\n"
-        "Date: Wed, 15 Jun 2022 16:02:00 +0000\r\n"
-        "\r\n"
-        "This is a test email body.\r\n"
-        "Best regards,\r\n"
-        "Sender"
-    )
-    headers = {
-        "Content-Type": "application/json"
-    }
-    payload = {
-        "rawEmail": raw_email
-    }
+# Sample raw email content for parsing, serialized once for every run
+_RAW = (
+    "From: sender@example.com\r\n"
+    "To: recipient@example.com\r\n"
+    "Subject: Test Email Parsing\r\n"
+    "Date: Wed, 15 Jun 2022 16:02:00 +0000\r\n"
+    "\r\n"
+    "This is a test email body.\r\n"
+    "Best regards,\r\n"
+    "Sender"
+)
+_BODY = json.dumps({"rawEmail": _RAW}).encode("utf-8")
 
+def test_email_parsing_functionality():
     try:
-        response = requests.post(EMAIL_PARSE_ENDPOINT, json=payload, headers=headers, timeout=TIMEOUT)
+        response = session.post(EMAIL_PARSE_ENDPOINT, data=_BODY, timeout=TIMEOUT)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         assert False, f"Request failed: {e}"
@@ -45,4 +44,5 @@ def test_email_parsing_functionality():
     assert parsed_data["date"] == "Wed, 15 Jun 2022 16:02:00 +0000", "Incorrect 'date' field parsing"
     assert "This is a test email body." in parsed_data["body"], "Email body text missing or incorrect"
 
-test_email_parsing_functionality()
\ No newline at end of file
+if __name__ == "__main__":
+    test_email_parsing_functionality()
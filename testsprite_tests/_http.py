@@ -0,0 +1,182 @@
+import json
+import os
+import socket
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib
+    orjson = None
+
+# Small request bodies should go out immediately and idle pooled connections
+# should stay open between tests. urllib3 already sets TCP_NODELAY by default;
+# overriding socket_options replaces that list, so keep it and add keep-alive.
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class _LocalAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+# One keep-alive pool shared by every TC file, so consecutive calls to the
+# local server reuse the same connection instead of reconnecting each time.
+# Retries are off so a failing endpoint fails the test straight away.
+ADAPTER = _LocalAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=0, connect=0, read=0),
+)
+
+
+def pooled_session():
+    """New session with its own headers and cookies on the shared pool.
+
+    For TC files that log in, out or otherwise change session state, so that
+    state doesn't leak into the files running concurrently on SESSION.
+    Don't close it: that would close the shared ADAPTER too.
+    """
+    session = requests.Session()
+    session.headers["Content-Type"] = "application/json"
+    session.mount("http://", ADAPTER)
+    return session
+
+
+SESSION = pooled_session()
+
+def encode(obj):
+    """Serialize a request body to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def decode(response):
+    """Parse a JSON response body straight from its bytes."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+CASSETTE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cassettes")
+# Replay needs request bodies that are identical from run to run
+VCR_ENABLED = bool(os.environ.get("TESTSPRITE_VCR"))
+
+
+# Cassettes are meant to be committed, so credentials never go into them
+_SECRET_HEADERS = ["authorization", "cookie", "set-cookie"]
+_SECRET_FIELDS = ("password", "oldPassword", "newPassword", "token", "sessionId")
+_FILTERED = "FILTERED"
+
+
+def _scrub(data):
+    if isinstance(data, dict):
+        return {key: _FILTERED if key in _SECRET_FIELDS else _scrub(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_scrub(item) for item in data]
+    return data
+
+
+def _scrub_response(response):
+    headers = response["headers"]
+    for header in [header for header in headers if header.lower() in _SECRET_HEADERS]:
+        del headers[header]
+    body = response["body"]["string"]
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return response
+    body = response["body"]["string"] = json.dumps(_scrub(data)).encode("utf-8")
+    # Replay would otherwise fail on a body shorter or longer than announced
+    for header in headers:
+        if header.lower() == "content-length":
+            headers[header] = [str(len(body))]
+    return response
+
+
+def use_cassette(name):
+    """Record a test's HTTP traffic once and replay it on later runs.
+
+    Only active when TESTSPRITE_VCR is set (requires `pip install vcrpy`);
+    by default the tests keep talking to the live server. VCR patches the
+    HTTP stack process-wide, so record cassettes with one test at a time.
+    Requests sent from worker threads are not captured reliably, so while
+    VCR is on send every request from the test's own thread; anything
+    missing from the recording is not guaranteed to be stopped on replay
+    and may still reach the server. Delete the file to re-record.
+    Credentials (auth headers, cookies, passwords and tokens in JSON
+    bodies) are replaced before anything is written to the cassette.
+    """
+    def decorator(test):
+        if not VCR_ENABLED:
+            return test
+        import vcr
+        return vcr.use_cassette(
+            os.path.join(CASSETTE_DIR, f"{name}.yaml"),
+            record_mode="once",
+            match_on=["method", "scheme", "host", "port", "path", "body"],
+            decode_compressed_response=True,
+            filter_headers=_SECRET_HEADERS,
+            filter_post_data_parameters=[(field, _FILTERED) for field in _SECRET_FIELDS],
+            before_record_response=_scrub_response,
+        )(test)
+    return decorator
+
+
+# (connect, read) for the login helper below
+LOGIN_TIMEOUT = (1.0, 10.0)
+PREFLIGHT_TIMEOUT = (0.5, 2.0)
+# Account for the tests that just need to be logged in. It must not be TC001's
+# default_user: TC001 changes that user's password while it runs, and the TC
+# files run concurrently. Defaults to the user scripts/create-test-user.ts makes.
+API_LOGIN = {
+    "email": os.environ.get("TESTSPRITE_API_EMAIL", "testuser@example.com"),
+    "password": os.environ.get("TESTSPRITE_API_PASSWORD", "correct_password")
+}
+
+_AUTH_CACHE = {}
+_AUTH_LOCK = threading.Lock()
+
+
+def login(base_url):
+    """Return a session logged in as the API test user, once per server.
+
+    It shares SESSION's connection pool but keeps its own headers and
+    cookies, so TC files that log in and out on SESSION can't affect it.
+    """
+    with _AUTH_LOCK:
+        session = _AUTH_CACHE.get(base_url)
+        if session is None:
+            session = _AUTH_CACHE[base_url] = _login(base_url)
+        return session
+
+
+# Login runs before the test functions (pytest fixture, script entry point),
+# so it gets a cassette of its own to be recorded and replayed as well
+@use_cassette("login")
+def _login(base_url):
+    session = pooled_session()
+    # Cheap public request first: fails fast if the server is down and
+    # leaves a warm pooled connection for the calls that follow. Only the
+    # connect is meant to fail fast; a slow answer (next dev compiling the
+    # route on first hit, health checking the DB) is no reason to give up.
+    try:
+        session.get(f"{base_url}/api/health", timeout=PREFLIGHT_TIMEOUT)
+    except requests.ReadTimeout:
+        pass
+    login_resp = session.post(f"{base_url}/api/auth/login", data=encode(API_LOGIN), timeout=LOGIN_TIMEOUT)
+    assert login_resp.status_code == 200, f"Login failed: {login_resp.status_code} {login_resp.text}"
+    # Bearer token when the server issues one, otherwise the cookie the
+    # login response set on this session stays in charge
+    login_data = decode(login_resp)
+    if "token" in login_data:
+        session.headers["Authorization"] = f"Bearer {login_data['token']}"
+    return session
@@ -0,0 +1,11 @@
+import pytest
+
+from _http import login
+
+BASE_URL = "http://localhost:3000"
+
+
+@pytest.fixture(scope="session")
+def http():
+    """Pooled session logged in once for the whole pytest run."""
+    yield login(BASE_URL)